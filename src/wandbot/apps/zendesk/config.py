@@ -1,3 +1,5 @@
+import functools
+
 from pydantic import AnyHttpUrl, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -25,3 +27,9 @@ class zendesk_app_config(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", extra="allow"
     )
+
+
+@functools.lru_cache(maxsize=1)
+def get_zendesk_app_config() -> zendesk_app_config:
+    """Returns the zendesk app config, parsing the environment only once."""
+    return zendesk_app_config()
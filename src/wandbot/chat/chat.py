@@ -37,7 +37,6 @@ from llama_index.callbacks import (
 )
 from llama_index.chat_engine import ContextChatEngine
 from llama_index.chat_engine.types import AgentChatResponse
-from llama_index.indices.postprocessor import CohereRerank
 from llama_index.llms import LLM, ChatMessage, MessageRole
 from llama_index.llms.generic_utils import messages_to_history_str
 from llama_index.memory import BaseMemory
@@ -51,9 +50,8 @@ from wandbot.chat.config import ChatConfig
 from wandbot.chat.prompts import load_chat_prompt, partial_format
 from wandbot.chat.query_enhancer import CompleteQuery, QueryHandler
 from wandbot.chat.retriever import (
+    FusedMetadataLanguagePostprocessor,
     HybridRetriever,
-    LanguageFilterPostprocessor,
-    MetadataPostprocessor,
     Retriever,
 )
 from wandbot.chat.schemas import ChatRequest, ChatResponse
@@ -313,13 +311,10 @@ class Chat:
             similarity_top_k=initial_k,
             response_mode="compact",
             node_postprocessors=[
-                MetadataPostprocessor(),
-                LanguageFilterPostprocessor(languages=[language, "python"]),
-                CohereRerank(top_n=top_k, model="rerank-english-v2.0")
-                if language == "en"
-                else CohereRerank(
-                    top_n=top_k, model="rerank-multilingual-v2.0"
+                FusedMetadataLanguagePostprocessor(
+                    languages=[language, "python"]
                 ),
+                self.retriever.load_reranker(language=language, top_k=top_k),
             ],
             prefix_messages=self.qa_prompt.message_templates,
         )
@@ -1,8 +1,22 @@
+import contextvars
+import copy
+import functools
+import itertools
+import json
+import operator
 import os
 import pathlib
-from typing import Any, Dict, List, Optional
-
+import platform
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import faiss
+import numpy as np
 import requests
+from cachetools import TTLCache
 from llama_index import (
     QueryBundle,
     ServiceContext,
@@ -17,11 +31,19 @@ from llama_index.query_engine import RetrieverQueryEngine
 from llama_index.response_synthesizers import BaseSynthesizer, ResponseMode
 from llama_index.retrievers import BM25Retriever
 from llama_index.schema import NodeWithScore, QueryType, TextNode
+from llama_index.storage.docstore import BaseDocumentStore
+from llama_index.utils import globals_helper
 from llama_index.vector_stores import FaissVectorStore
 from llama_index.vector_stores.simple import DEFAULT_VECTOR_STORE, NAMESPACE_SEP
-from llama_index.vector_stores.types import DEFAULT_PERSIST_FNAME
+from llama_index.vector_stores.types import (
+    DEFAULT_PERSIST_FNAME,
+    VectorStoreQueryResult,
+)
+from nltk.stem import PorterStemmer
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import wandb
 from wandbot.utils import (
@@ -30,47 +52,158 @@ from wandbot.utils import (
     load_service_context,
 )
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = get_logger(__name__)
 
+if platform.machine().lower() in ("x86_64", "amd64") and not any(
+    simd in faiss.get_compile_options() for simd in ("AVX2", "AVX512")
+):
+    logger.warning(
+        "faiss is not built with AVX2 support, vector search will not "
+        "use SIMD distance kernels."
+    )
 
-class LanguageFilterPostprocessor(BaseNodePostprocessor):
-    """Language-based Node processor."""
+QUERY_ENGINE_CACHE_SIZE = 32
+RERANK_MODEL_EN = "rerank-english-v2.0"
+RERANK_MODEL_MULTILINGUAL = "rerank-multilingual-v2.0"
 
-    languages: List[str] = ["en", "python"]
-    min_result_size: int = 10
+_get_metadata = operator.attrgetter("metadata")
+_get_tags = operator.itemgetter("tags")
 
-    @classmethod
-    def class_name(cls) -> str:
-        return "LanguageFilterPostprocessor"
+# tags of nodes that are not in the docstore (You.com results, no-result nodes)
+_EXTRA_TAGS = ("you.com", "no-result")
 
-    def _postprocess_nodes(
-        self,
-        nodes: List[NodeWithScore],
-        query_bundle: Optional[QueryBundle] = None,
-    ) -> List[NodeWithScore]:
-        """Postprocess nodes."""
 
-        new_nodes = []
-        for node in nodes:
-            if node.metadata["language"] in self.languages:
-                new_nodes.append(node)
+def _normalize_tag(tag: str) -> str:
+    return tag.lower().strip()
 
-        if len(new_nodes) < self.min_result_size:
-            return new_nodes + nodes[: self.min_result_size - len(new_nodes)]
 
-        return new_nodes
+def build_tag_vocabulary(tags: Iterable[str]) -> Dict[str, int]:
+    """Assigns a bit to every tag, including those of non-docstore nodes.
+
+    Args:
+        tags: An iterable of strings representing the known tags.
+
+    Returns:
+        A dictionary mapping each normalized tag to its bit.
+    """
+    tags = set(map(_normalize_tag, tags)).union(_EXTRA_TAGS)
+    return {tag: 1 << i for i, tag in enumerate(sorted(tags))}
+
+
+def load_tag_vocabulary(docstore: BaseDocumentStore) -> Dict[str, int]:
+    """Builds the tag vocabulary of the nodes in a docstore.
+
+    Filtering on a fixed vocabulary lets the tag checks run as bitmask
+    operations instead of list membership tests.
+
+    Args:
+        docstore: The document store holding the indexed nodes.
+
+    Returns:
+        A dictionary mapping each normalized tag to its bit.
+    """
+    return build_tag_vocabulary(
+        tag
+        for node in docstore.docs.values()
+        for tag in node.metadata.get("tags", [])
+    )
+
+
+def tag_bits(tags: Iterable[str], vocabulary: Dict[str, int]) -> int:
+    """Encodes a set of tags as a bitmask, ignoring tags without a bit.
+
+    Args:
+        tags: An iterable of strings representing the tags.
+        vocabulary: A dictionary mapping each normalized tag to its bit.
+
+    Returns:
+        An integer with the bits of the known tags set.
+    """
+    bits = 0
+    for tag in tags:
+        bits |= vocabulary.get(_normalize_tag(tag), 0)
+    return bits
+
+
+def _tag_masks(
+    include_tags: List[str] | None,
+    exclude_tags: List[str] | None,
+    vocabulary: Dict[str, int],
+) -> Tuple[int | None, int]:
+    """Returns the include and exclude masks for a tag filter.
+
+    The include mask is None when an include tag is unknown, since no node
+    can have it. An unknown exclude tag likewise means no node has all the
+    exclude tags, so the exclude filter is ignored.
+    """
+    include_tags = include_tags or []
+    exclude_tags = exclude_tags or []
+    if not all(_normalize_tag(tag) in vocabulary for tag in include_tags):
+        return None, 0
+    if not all(_normalize_tag(tag) in vocabulary for tag in exclude_tags):
+        return tag_bits(include_tags, vocabulary), 0
+    return (
+        tag_bits(include_tags, vocabulary),
+        tag_bits(exclude_tags, vocabulary),
+    )
+
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_STOPWORDS = frozenset(globals_helper.stopwords)
+_stemmer = PorterStemmer()
+
+
+@functools.lru_cache(maxsize=65536)
+def _stem(word: str) -> str:
+    return _stemmer.stem(word)
+
+
+def fast_tokenize(text: str) -> List[str]:
+    """Tokenizes text for BM25 retrieval.
+
+    Mirrors llama-index's default BM25 tokenizer (lowercase, stopword removal,
+    unique raw tokens, then porter stemming) without building a pandas series
+    per text. Like the default, distinct words that share a stem each count.
+
+    Args:
+        text: A string representing the text to tokenize.
+
+    Returns:
+        A list of stemmed tokens, one per unique raw token.
+    """
+    tokens = _TOKEN_PATTERN.findall(text.lower())
+    return [
+        _stem(token)
+        for token in dict.fromkeys(tokens)
+        if token not in _STOPWORDS
+    ]
+
 
+class FusedMetadataLanguagePostprocessor(BaseNodePostprocessor):
+    """Metadata and language based Node processor.
 
-class MetadataPostprocessor(BaseNodePostprocessor):
-    """Metadata-based Node processor."""
+    Filters nodes by their tags and language in a single pass. Nodes in other
+    languages are used to top up to `min_result_size`, and no-result nodes pad
+    the rest when a tag filter is set.
+    """
 
+    languages: List[str] = ["en", "python"]
     min_result_size: int = 10
     include_tags: List[str] | None = None
     exclude_tags: List[str] | None = None
+    # tag bits of the index being filtered, built from the nodes when unset
+    tag_vocabulary: Dict[str, int] | None = None
 
     @classmethod
     def class_name(cls) -> str:
-        return "MetadataPostprocessor"
+        return "FusedMetadataLanguagePostprocessor"
 
     def _postprocess_nodes(
         self,
@@ -78,33 +211,56 @@ class MetadataPostprocessor(BaseNodePostprocessor):
         query_bundle: Optional[QueryBundle] = None,
     ) -> List[NodeWithScore]:
         """Postprocess nodes."""
-        if not self.include_tags and not self.exclude_tags:
-            return nodes
+        languages = frozenset(self.languages)
+        filter_tags = bool(self.include_tags or self.exclude_tags)
+        if not filter_tags:
+            # nothing to drop, so keep the retrieval order untouched
+            if len(nodes) <= self.min_result_size:
+                return nodes
+            if all(
+                _get_metadata(node).get("language") in languages
+                for node in nodes
+            ):
+                return nodes
+        vocabulary = self.tag_vocabulary
+        if filter_tags and vocabulary is None:
+            vocabulary = build_tag_vocabulary(
+                tag for node in nodes for tag in _get_tags(_get_metadata(node))
+            )
+        include_bits, exclude_bits = _tag_masks(
+            self.include_tags, self.exclude_tags, vocabulary or {}
+        )
+        # many nodes share a tag list, so encode each distinct one only once
+        node_bits: Dict[Tuple[str, ...], int] = {}
+
         new_nodes = []
+        other_language_nodes = []
         for node in nodes:
-            normalized_tags = [
-                tag.lower().strip() for tag in node.metadata["tags"]
-            ]
-            if self.include_tags:
-                normalized_include_tags = [
-                    tag.lower().strip() for tag in self.include_tags
-                ]
-                if not set(normalized_include_tags).issubset(
-                    set(normalized_tags)
-                ):
+            metadata = _get_metadata(node)
+            if filter_tags:
+                if include_bits is None:
                     continue
-            if self.exclude_tags:
-                normalized_exclude_tags = [
-                    tag.lower().strip() for tag in self.exclude_tags
-                ]
-                if set(normalized_exclude_tags).issubset(set(normalized_tags)):
+                tags = tuple(_get_tags(metadata))
+                bits = node_bits.get(tags)
+                if bits is None:
+                    bits = node_bits[tags] = tag_bits(tags, vocabulary)
+                if bits & include_bits != include_bits:
                     continue
-            new_nodes.append(node)
-        if len(new_nodes) < self.min_result_size:
+                if exclude_bits and bits & exclude_bits == exclude_bits:
+                    continue
+            if metadata.get("language") in languages:
+                new_nodes.append(node)
+            else:
+                other_language_nodes.append(node)
+
+        # top up with the highest ranked nodes in other languages
+        deficit = self.min_result_size - len(new_nodes)
+        if deficit > 0:
+            new_nodes.extend(other_language_nodes[:deficit])
+            deficit = self.min_result_size - len(new_nodes)
+        if filter_tags and deficit > 0:
             dummy_node = create_no_result_dummy_node()
-            new_nodes.extend(
-                [dummy_node] * (self.min_result_size - len(new_nodes))
-            )
+            new_nodes.extend(itertools.repeat(dummy_node, deficit))
         return new_nodes
 
 
@@ -122,12 +278,26 @@ class YouRetriever(BaseRetriever):
         self.similarity_top_k = (
             similarity_top_k if similarity_top_k <= 20 else 20
         )
+        # reuse the HTTPS connection to the You.com API across retrievals
+        self._session = requests.Session()
+        self._session.headers.update({"X-API-Key": self._api_key})
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=10,
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.2,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                ),
+            ),
+        )
         super().__init__(callback_manager)
 
     def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
         """Retrieve."""
         try:
-            headers = {"X-API-Key": self._api_key}
             url = "https://api.ydc-index.io/search"
 
             querystring = {
@@ -135,31 +305,29 @@ class YouRetriever(BaseRetriever):
                 + query_bundle.query_str,
                 "num_web_results": self.similarity_top_k,
             }
-            response = requests.get(url, headers=headers, params=querystring)
+            response = self._session.get(
+                url, params=querystring, timeout=(3.05, 10)
+            )
             if response.status_code != 200:
                 return []
             else:
-                results = response.json()
-
-            search_hits = [
-                (
-                    "\n".join(hit["snippets"]),
-                    {
-                        "source": hit["url"],
-                        "language": "en",
-                        "description": hit["description"],
-                        "title": hit["title"],
-                        "tags": ["you.com"],
-                    },
-                )
-                for hit in results["hits"]
-            ]
+                results = _json_loads(response.content)
+
             return [
                 NodeWithScore(
-                    node=TextNode(text=s[0], metadata=s[1]),
+                    node=TextNode(
+                        text="\n".join(hit["snippets"]),
+                        metadata={
+                            "source": hit["url"],
+                            "language": "en",
+                            "description": hit["description"],
+                            "title": hit["title"],
+                            "tags": ["you.com"],
+                        },
+                    ),
                     score=1.0,
                 )
-                for s in search_hits
+                for hit in results["hits"]
             ]
         except Exception as e:
             return []
@@ -174,6 +342,7 @@ class HybridRetriever(BaseRetriever):
     ):
         self.index = index
         self.storage_context = storage_context
+        self.similarity_top_k = similarity_top_k
 
         self.vector_retriever = self.index.as_retriever(
             similarity_top_k=similarity_top_k,
@@ -182,30 +351,89 @@ class HybridRetriever(BaseRetriever):
         self.bm25_retriever = BM25Retriever.from_defaults(
             docstore=self.index.docstore,
             similarity_top_k=similarity_top_k,
+            tokenizer=fast_tokenize,
         )
+        self.tag_vocabulary = load_tag_vocabulary(self.index.docstore)
         self.you_retriever = YouRetriever(
             api_key=os.environ.get("YOU_API_KEY"),
             similarity_top_k=similarity_top_k,
         )
+        self._executor = ThreadPoolExecutor(max_workers=3)
         super().__init__()
 
-    def _retrieve(self, query: QueryBundle, **kwargs):
-        bm25_nodes = self.bm25_retriever.retrieve(query)
-        vector_nodes = self.vector_retriever.retrieve(query)
-        you_nodes = (
-            self.you_retriever.retrieve(query)
+    def _submit(self, retriever: BaseRetriever, query: QueryBundle):
+        # copy the context so the callback trace stack carries over
+        ctx = contextvars.copy_context()
+        return self._executor.submit(ctx.run, retriever.retrieve, query)
+
+    def _vector_retrieve_batch(
+        self, queries: List[QueryBundle]
+    ) -> List[List[NodeWithScore]]:
+        """Embeds the queries concurrently and runs a single faiss search."""
+        embed_model = self.index.service_context.embed_model
+        futures = [
+            self._executor.submit(
+                contextvars.copy_context().run,
+                embed_model.get_agg_embedding_from_queries,
+                query.embedding_strs,
+            )
+            for query in queries
+        ]
+        embeddings = [future.result() for future in futures]
+        distances, ids = self.index.vector_store.client.search(
+            np.asarray(embeddings, dtype=np.float32), self.similarity_top_k
+        )
+        vector_retriever = self.vector_retriever
+        results = []
+        for query, row_distances, row_ids in zip(queries, distances, ids):
+            hits = [
+                (str(i), float(d))
+                for i, d in zip(row_ids, row_distances)
+                if i != -1
+            ]
+            query_result = VectorStoreQueryResult(
+                ids=[i for i, _ in hits],
+                similarities=[d for _, d in hits],
+            )
+            with vector_retriever.callback_manager.event(
+                CBEventType.RETRIEVE,
+                payload={EventPayload.QUERY_STR: query.query_str},
+            ) as retrieve_event:
+                # same id to node mapping the vector retriever applies
+                nodes = vector_retriever._build_node_list_from_query_result(
+                    query_result
+                )
+                retrieve_event.on_end(payload={EventPayload.NODES: nodes})
+            results.append(nodes)
+        return results
+
+    def _retrieve(
+        self,
+        query: QueryBundle,
+        vector_nodes: Optional[List[NodeWithScore]] = None,
+        **kwargs,
+    ):
+        bm25_future = self._submit(self.bm25_retriever, query)
+        vector_future = (
+            self._submit(self.vector_retriever, query)
+            if vector_nodes is None
+            else None
+        )
+        you_future = (
+            self._submit(self.you_retriever, query)
             if not kwargs.get("is_avoid_query", False)
-            else []
+            else None
         )
+        bm25_nodes = bm25_future.result()
+        if vector_future is not None:
+            vector_nodes = vector_future.result()
+        you_nodes = you_future.result() if you_future is not None else []
 
-        # combine the two lists of nodes
-        all_nodes = []
-        node_ids = set()
-        for n in bm25_nodes + vector_nodes + you_nodes:
-            if n.node.node_id not in node_ids:
-                all_nodes.append(n)
-                node_ids.add(n.node.node_id)
-        return all_nodes
+        # combine the lists of nodes, keeping the first occurrence of each id
+        unique_nodes = {}
+        for n in itertools.chain(bm25_nodes, vector_nodes, you_nodes):
+            unique_nodes.setdefault(n.node.node_id, n)
+        return list(unique_nodes.values())
 
     def retrieve(
         self, str_or_query_bundle: QueryType, **kwargs
@@ -227,6 +455,24 @@ class HybridRetriever(BaseRetriever):
                 )
         return nodes
 
+    def retrieve_batch(
+        self, queries: List[QueryType], **kwargs
+    ) -> List[List[NodeWithScore]]:
+        # faiss cannot search an empty (0,) shaped query array
+        if not queries:
+            return []
+        query_bundles = [
+            QueryBundle(query) if isinstance(query, str) else query
+            for query in queries
+        ]
+        batch_vector_nodes = self._vector_retrieve_batch(query_bundles)
+        return [
+            self.retrieve(query_bundle, vector_nodes=vector_nodes, **kwargs)
+            for query_bundle, vector_nodes in zip(
+                query_bundles, batch_vector_nodes
+            )
+        ]
+
 
 class RetrieverConfig(BaseSettings):
     index_artifact: str = Field(
@@ -249,11 +495,29 @@ class RetrieverConfig(BaseSettings):
         default="en",
         env="RETRIEVER_LANGUAGE",
     )
+    nprobe: int = Field(
+        default=10,
+        env="RETRIEVER_NPROBE",
+    )
+    retrieval_cache_size: int = Field(
+        default=512,
+        env="RETRIEVER_CACHE_SIZE",
+    )
+    retrieval_cache_ttl: int = Field(
+        default=600,
+        env="RETRIEVER_CACHE_TTL",
+    )
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", extra="allow"
     )
 
 
+@functools.lru_cache(maxsize=1)
+def get_retriever_config() -> RetrieverConfig:
+    """Returns the retriever config, parsing the environment only once."""
+    return RetrieverConfig()
+
+
 class WandbRetrieverQueryEngine(RetrieverQueryEngine):
     def __init__(
         self,
@@ -275,6 +539,15 @@ class WandbRetrieverQueryEngine(RetrieverQueryEngine):
         nodes = self._retriever.retrieve(query_bundle, **kwargs)
         return self._apply_node_postprocessors(nodes, query_bundle=query_bundle)
 
+    def retrieve_batch(
+        self, query_bundles: List[QueryBundle], **kwargs
+    ) -> List[List[NodeWithScore]]:
+        batch_nodes = self._retriever.retrieve_batch(query_bundles, **kwargs)
+        return [
+            self._apply_node_postprocessors(nodes, query_bundle=query_bundle)
+            for query_bundle, nodes in zip(query_bundles, batch_nodes)
+        ]
+
 
 class Retriever:
     def __init__(
@@ -285,7 +558,9 @@ class Retriever:
         callback_manager: CallbackManager | None = None,
     ):
         self.config = (
-            config if isinstance(config, RetrieverConfig) else RetrieverConfig()
+            config
+            if isinstance(config, RetrieverConfig)
+            else get_retriever_config()
         )
         self.run = run
         self.service_context = (
@@ -308,6 +583,37 @@ class Retriever:
             storage_context=self.storage_context,
         )
         self.is_avoid_query: bool | None = None
+        self._engine_cache: OrderedDict[
+            Tuple, WandbRetrieverQueryEngine
+        ] = OrderedDict()
+        self._rerankers: Dict[Tuple[str, int], CohereRerank] = {}
+        # bounded in age as well as size, so transient You.com failures
+        # (which come back as empty web results) are not kept for long
+        self._retrieval_cache: TTLCache = TTLCache(
+            maxsize=self.config.retrieval_cache_size,
+            ttl=self.config.retrieval_cache_ttl,
+        )
+        self._retrieval_cache_lock = threading.Lock()
+        self._default_engine: WandbRetrieverQueryEngine | None = None
+
+    def load_reranker(self, language: str, top_k: int) -> CohereRerank:
+        """Returns a shared Cohere reranker for the given language and top k.
+
+        Args:
+            language: A string representing the language of the query.
+            top_k: An integer representing the number of results to keep.
+
+        Returns:
+            An instance of CohereRerank.
+        """
+        model = (
+            RERANK_MODEL_EN if language == "en" else RERANK_MODEL_MULTILINGUAL
+        )
+        reranker = self._rerankers.get((model, top_k))
+        if reranker is None:
+            reranker = CohereRerank(top_n=top_k, model=model)
+            self._rerankers[(model, top_k)] = reranker
+        return reranker
 
     def load_storage_context_from_artifact(
         self, artifact_url: str
@@ -324,8 +630,11 @@ class Retriever:
         artifact_dir = artifact.download()
         index_path = f"{artifact_dir}/{DEFAULT_VECTOR_STORE}{NAMESPACE_SEP}{DEFAULT_PERSIST_FNAME}"
         logger.debug(f"Loading index from {index_path}")
+        vector_store = FaissVectorStore.from_persist_path(index_path)
+        if isinstance(vector_store.client, faiss.IndexIVF):
+            vector_store.client.nprobe = self.config.nprobe
         storage_context = StorageContext.from_defaults(
-            vector_store=FaissVectorStore.from_persist_path(index_path),
+            vector_store=vector_store,
             persist_dir=artifact_dir,
         )
         return storage_context
@@ -344,26 +653,65 @@ class Retriever:
         if is_avoid_query is not None:
             self.is_avoid_query = is_avoid_query
 
+        # the default engine is kept outside the bounded cache so it is never
+        # evicted by requests with tag filters
+        if (
+            not include_tags
+            and not exclude_tags
+            and top_k == self.config.top_k
+            and language == self.config.language
+        ):
+            if self._default_engine is None:
+                self._default_engine = self._build_query_engine(
+                    top_k=top_k, language=language
+                )
+            return self._default_engine
+
+        cache_key = (
+            top_k,
+            language,
+            tuple(include_tags or ()),
+            tuple(exclude_tags or ()),
+        )
+        query_engine = self._engine_cache.get(cache_key)
+        if query_engine is not None:
+            self._engine_cache.move_to_end(cache_key)
+            return query_engine
+
+        query_engine = self._build_query_engine(
+            top_k=top_k,
+            language=language,
+            include_tags=include_tags,
+            exclude_tags=exclude_tags,
+        )
+        self._engine_cache[cache_key] = query_engine
+        if len(self._engine_cache) > QUERY_ENGINE_CACHE_SIZE:
+            self._engine_cache.popitem(last=False)
+        return query_engine
+
+    def _build_query_engine(
+        self,
+        top_k: int,
+        language: str,
+        include_tags: List[str] | None = None,
+        exclude_tags: List[str] | None = None,
+    ) -> WandbRetrieverQueryEngine:
         node_postprocessors = [
-            MetadataPostprocessor(
+            FusedMetadataLanguagePostprocessor(
+                languages=[language, "python"],
                 include_tags=include_tags,
                 exclude_tags=exclude_tags,
                 min_result_size=top_k,
+                tag_vocabulary=self._retriever.tag_vocabulary,
             ),
-            LanguageFilterPostprocessor(
-                languages=[language, "python"], min_result_size=top_k
-            ),
-            CohereRerank(top_n=top_k, model="rerank-english-v2.0")
-            if language == "en"
-            else CohereRerank(top_n=top_k, model="rerank-multilingual-v2.0"),
+            self.load_reranker(language=language, top_k=top_k),
         ]
-        query_engine = WandbRetrieverQueryEngine.from_args(
+        return WandbRetrieverQueryEngine.from_args(
             retriever=self._retriever,
             node_postprocessors=node_postprocessors,
             response_mode=ResponseMode.NO_TEXT,
             service_context=self.service_context,
         )
-        return query_engine
 
     def retrieve(
         self,
@@ -386,36 +734,137 @@ class Retriever:
         Returns:
             A list of dictionaries representing the retrieved results.
         """
-        top_k = top_k or self.config.top_k
-        language = language or self.config.language
-
-        retrieval_engine = self.load_query_engine(
-            top_k=top_k,
+        retrieval_engine, avoid_query = self._load_retrieval_engine(
             language=language,
+            top_k=top_k,
             include_tags=include_tags,
             exclude_tags=exclude_tags,
+            is_avoid_query=is_avoid_query,
+        )
+        results = retrieval_engine.retrieve(
+            QueryBundle(query_str=query), is_avoid_query=avoid_query
         )
+        return self._format_results(results)
 
-        avoid_query = self.is_avoid_query or is_avoid_query
+    def retrieve_batch(
+        self,
+        queries: List[str],
+        language: str | None = None,
+        top_k: int | None = None,
+        include_tags: List[str] | None = None,
+        exclude_tags: List[str] | None = None,
+        is_avoid_query: bool | None = False,
+    ):
+        """Retrieves the top k results from the index for each given query.
 
-        query_bundle = QueryBundle(query_str=query)
-        results = retrieval_engine.retrieve(
-            query_bundle, is_avoid_query=bool(avoid_query)
+        The query embeddings are computed concurrently and the vector index is
+        searched once for the whole batch.
+
+        Args:
+            queries: A list of strings representing the queries.
+            language: A string representing the language of the queries.
+            top_k: An integer representing the number of top results to retrieve.
+            include_tags: A list of strings representing the tags to include in the results.
+            exclude_tags: A list of strings representing the tags to exclude from the results.
+
+        Returns:
+            A list with the retrieved results for each query.
+        """
+        retrieval_engine, avoid_query = self._load_retrieval_engine(
+            language=language,
+            top_k=top_k,
+            include_tags=include_tags,
+            exclude_tags=exclude_tags,
+            is_avoid_query=is_avoid_query,
+        )
+        batch_results = retrieval_engine.retrieve_batch(
+            [QueryBundle(query_str=query) for query in queries],
+            is_avoid_query=avoid_query,
         )
+        return [self._format_results(results) for results in batch_results]
 
-        outputs = [
+    def _load_retrieval_engine(
+        self,
+        language: str | None,
+        top_k: int | None,
+        include_tags: List[str] | None,
+        exclude_tags: List[str] | None,
+        is_avoid_query: bool | None,
+    ) -> Tuple[WandbRetrieverQueryEngine, bool]:
+        retrieval_engine = self.load_query_engine(
+            top_k=top_k or self.config.top_k,
+            language=language or self.config.language,
+            include_tags=include_tags,
+            exclude_tags=exclude_tags,
+        )
+        avoid_query = bool(self.is_avoid_query or is_avoid_query)
+        self.is_avoid_query = None
+        return retrieval_engine, avoid_query
+
+    @staticmethod
+    def _format_results(results: List[NodeWithScore]) -> List[Dict[str, Any]]:
+        get_text = NodeWithScore.get_text
+        get_score = NodeWithScore.get_score
+        return [
             {
-                "text": node.get_text(),
+                "text": get_text(node),
                 "metadata": node.metadata,
-                "score": node.get_score(),
+                "score": get_score(node),
             }
             for node in results
         ]
-        self.is_avoid_query = None
-        return outputs
 
-    def __call__(self, query: str, **kwargs) -> List[Dict[str, Any]]:
-        retrievals = self.retrieve(query, **kwargs)
+    def __call__(
+        self,
+        query: Union[str, List[str]],
+        language: str | None = None,
+        top_k: int | None = None,
+        include_tags: List[str] | None = None,
+        exclude_tags: List[str] | None = None,
+        is_avoid_query: bool | None = False,
+    ) -> List[Dict[str, Any]] | List[List[Dict[str, Any]]]:
+        if not isinstance(query, str):
+            retrievals = self.retrieve_batch(
+                query,
+                language=language,
+                top_k=top_k,
+                include_tags=include_tags,
+                exclude_tags=exclude_tags,
+                is_avoid_query=is_avoid_query,
+            )
+            logger.debug(f"Retrieved results for {len(retrievals)} queries.")
+            return retrievals
+
+        avoid_query = bool(self.is_avoid_query or is_avoid_query)
+        self.is_avoid_query = None
+        cache_key = (
+            query,
+            language or self.config.language,
+            top_k or self.config.top_k,
+            tuple(include_tags or ()),
+            tuple(exclude_tags or ()),
+            avoid_query,
+        )
+        with self._retrieval_cache_lock:
+            cached = self._retrieval_cache.get(cache_key)
+        if cached is None:
+            # results share metadata objects with the docstore, store a copy
+            cached = copy.deepcopy(
+                tuple(
+                    self.retrieve(
+                        query,
+                        language=language,
+                        top_k=top_k,
+                        include_tags=include_tags,
+                        exclude_tags=exclude_tags,
+                        is_avoid_query=avoid_query,
+                    )
+                )
+            )
+            with self._retrieval_cache_lock:
+                self._retrieval_cache[cache_key] = cached
+        # copy the cached results so callers cannot mutate the cache
+        retrievals = copy.deepcopy(list(cached))
         logger.debug(f"Retrieved {len(retrievals)} results.")
         logger.debug(f"Retrieval: {retrievals[0]}")
         return retrievals
@@ -12,7 +12,7 @@ Typical usage example:
 """
 import datetime
 import pathlib
-from typing import List, Optional, Union
+from typing import List, Literal, Optional, Union
 from urllib.parse import urlparse
 
 from pydantic import BaseModel, Field, model_validator
@@ -230,3 +230,8 @@ class VectorStoreConfig(BaseSettings):
     temperature: float = 0.1
     max_retries: int = 3
     embeddings_cache: pathlib.Path = pathlib.Path("data/cache/embeddings")
+    quantize_index: bool = False
+    ivf_nlist: Optional[int] = None
+    pq_m: Optional[int] = None
+    pq_nbits: int = 8
+    scalar_quantizer: Optional[Literal["fp16", "8bit"]] = None
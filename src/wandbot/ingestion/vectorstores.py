@@ -18,6 +18,8 @@ from typing import Any, Dict, List
 
 from langchain.schema import Document as LcDocument
 from llama_index.callbacks import WandbCallbackHandler
+from llama_index.vector_stores import FaissVectorStore
+from llama_index.vector_stores.simple import DEFAULT_VECTOR_STORE
 
 import wandb
 from wandbot.ingestion import preprocess_data
@@ -27,6 +29,7 @@ from wandbot.utils import (
     load_index,
     load_service_context,
     load_storage_context,
+    quantize_faiss_index,
 )
 
 logger = get_logger(__name__)
@@ -91,6 +94,17 @@ def load(
         storage_context,
         persist_dir=str(config.persist_dir),
     )
+    if config.quantize_index:
+        faiss_index = quantize_faiss_index(
+            storage_context.vector_store.client,
+            nlist=config.ivf_nlist,
+            m=config.pq_m,
+            nbits=config.pq_nbits,
+            scalar_quantizer=config.scalar_quantizer,
+        )
+        storage_context.vector_stores[DEFAULT_VECTOR_STORE] = FaissVectorStore(
+            faiss_index=faiss_index
+        )
     wandb_callback: WandbCallbackHandler = WandbCallbackHandler()
 
     wandb_callback.persist_index(index, index_name=result_artifact_name)
@@ -6,6 +6,7 @@ The module includes the following functions:
 - `load_llm`: Loads a language model with the specified parameters.
 - `load_service_context`: Loads a service context with the specified parameters.
 - `load_storage_context`: Loads a storage context with the specified parameters.
+- `quantize_faiss_index`: Compresses a flat faiss index into an IVF index.
 - `load_index`: Loads an index from storage or creates a new one if not found.
 
 The module also includes the following classes:
@@ -24,10 +25,11 @@ import datetime
 import hashlib
 import json
 import logging
+import math
 import os
 import pathlib
 import sqlite3
-from typing import Any, List, Optional
+from typing import Any, List, Literal, Optional
 
 import faiss
 import fasttext
@@ -188,6 +190,60 @@ def load_storage_context(embed_dimensions: int) -> StorageContext:
     return storage_context
 
 
+def quantize_faiss_index(
+    faiss_index: faiss.Index,
+    nlist: Optional[int] = None,
+    m: Optional[int] = None,
+    nbits: int = 8,
+    scalar_quantizer: Optional[Literal["fp16", "8bit"]] = None,
+) -> faiss.Index:
+    """Compresses a flat faiss index into an IVF index.
+
+    The vectors are stored with product quantization by default, or with a
+    scalar quantizer ("fp16" or "8bit") when one is given. The vectors are read
+    back from the flat index and added to the new index in the same order, so
+    the faiss ids stay aligned with the docstore.
+
+    Args:
+        faiss_index: The flat faiss index to compress.
+        nlist: The number of inverted lists. Defaults to sqrt of the index size.
+        m: The number of product quantizer sub-vectors. Defaults to about one
+            sub-vector per 16 dimensions.
+        nbits: The number of bits per sub-vector code.
+        scalar_quantizer: The scalar quantizer type to use instead of PQ.
+
+    Returns:
+        The compressed index, or the input index if it is not flat or too small
+        to train the quantizers on.
+    """
+    if not isinstance(faiss_index, faiss.IndexFlat):
+        return faiss_index
+    ntotal = faiss_index.ntotal
+    nlist = nlist or max(1, int(math.sqrt(ntotal)))
+    min_train_size = nlist if scalar_quantizer else max(nlist, 2**nbits)
+    if ntotal < min_train_size:
+        return faiss_index
+
+    vectors = faiss_index.reconstruct_n(0, ntotal)
+    quantizer = faiss.IndexFlatL2(faiss_index.d)
+    if scalar_quantizer:
+        qtype = {
+            "fp16": faiss.ScalarQuantizer.QT_fp16,
+            "8bit": faiss.ScalarQuantizer.QT_8bit,
+        }[scalar_quantizer]
+        ivf_index = faiss.IndexIVFScalarQuantizer(
+            quantizer, faiss_index.d, nlist, qtype, faiss.METRIC_L2
+        )
+    else:
+        # m has to divide the dimension, use the largest divisor <= d / 16
+        d = faiss_index.d
+        m = m or next(k for k in range(d // 16, 0, -1) if d % k == 0)
+        ivf_index = faiss.IndexIVFPQ(quantizer, faiss_index.d, nlist, m, nbits)
+    ivf_index.train(vectors)
+    ivf_index.add(vectors)
+    return ivf_index
+
+
 def load_index(
     nodes: Any,
     service_context: ServiceContext,